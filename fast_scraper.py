@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Fast test-mode scraper
+Simulates price lookups without touching the network so the web UI can be
+exercised end-to-end in seconds. The numeric simulation runs as a Numba
+prange kernel when numba is installed, a vectorized numpy pass when only
+numpy is, and a plain loop otherwise
+"""
+
+import csv
+from datetime import datetime
+
+from xero_price_updater import extract_sku_from_name, determine_website
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# Fraction bounds of the simulated price movement
+MAX_CHANGE = 0.15
+
+
+def _mix(seed):
+    """xorshift step - cheap deterministic per-row randomness"""
+    seed ^= (seed << 13) & 0xFFFFFFFF
+    seed ^= seed >> 17
+    seed ^= (seed << 5) & 0xFFFFFFFF
+    return seed & 0xFFFFFFFF
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _simulate_prices(old_prices, seeds):  # pragma: no cover - jitted
+        n = old_prices.shape[0]
+        new_prices = np.empty(n)
+        for i in prange(n):
+            seed = seeds[i]
+            seed ^= (seed << 13) & 0xFFFFFFFF
+            seed ^= seed >> 17
+            seed ^= (seed << 5) & 0xFFFFFFFF
+            seed &= 0xFFFFFFFF
+            if seed % 5 == 0:
+                # Simulate an unchanged price
+                new_prices[i] = old_prices[i]
+            else:
+                change = (seed % 1000) / 1000.0 * (2 * MAX_CHANGE) - MAX_CHANGE
+                new_prices[i] = round(old_prices[i] * (1.0 + change) * 100.0) / 100.0
+        return new_prices
+
+elif np is not None:
+
+    def _simulate_prices(old_prices, seeds):
+        seeds = seeds.astype(np.uint64)
+        seeds ^= (seeds << 13) & 0xFFFFFFFF
+        seeds ^= seeds >> 17
+        seeds ^= (seeds << 5) & 0xFFFFFFFF
+        seeds &= 0xFFFFFFFF
+        change = (seeds % 1000) / 1000.0 * (2 * MAX_CHANGE) - MAX_CHANGE
+        new_prices = np.round(old_prices * (1.0 + change), 2)
+        return np.where(seeds % 5 == 0, old_prices, new_prices)
+
+else:
+
+    def _simulate_prices(old_prices, seeds):
+        new_prices = []
+        for old, seed in zip(old_prices, seeds):
+            seed = _mix(seed)
+            if seed % 5 == 0:
+                new_prices.append(old)
+            else:
+                change = (seed % 1000) / 1000.0 * (2 * MAX_CHANGE) - MAX_CHANGE
+                new_prices.append(round(old * (1.0 + change), 2))
+        return new_prices
+
+
+def _row_seed(item_code, item_name):
+    """Stable per-row seed so reruns produce the same simulated prices"""
+    seed = 2166136261
+    for ch in (item_code + item_name):
+        seed = ((seed ^ ord(ch)) * 16777619) & 0xFFFFFFFF
+    return seed or 1
+
+
+def process_csv_fast(input_file, output_file, report_file, progress_callback=None):
+    """
+    Simulated version of the real scrape: same inputs, same outputs, no
+    network. Returns (updates, errors, unchanged) in the CLI dict format
+    """
+    with open(input_file, 'r', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        items = list(reader)
+
+    total = len(items)
+    old_prices = []
+    seeds = []
+    for item in items:
+        try:
+            price_str = (item.get('SalesUnitPrice') or '0').strip()
+            old_prices.append(float(price_str) if price_str else 0.0)
+        except ValueError:
+            old_prices.append(0.0)
+        seeds.append(_row_seed(item.get('ItemCode', item.get('*ItemCode', '')),
+                               item.get('ItemName', '')))
+
+    if np is not None:
+        simulated = _simulate_prices(np.asarray(old_prices, dtype=np.float64),
+                                     np.asarray(seeds, dtype=np.uint64))
+    else:
+        simulated = _simulate_prices(old_prices, seeds)
+
+    updates = []
+    errors = []
+    unchanged = []
+
+    for i, item in enumerate(items):
+        item_code = item.get('ItemCode', item.get('*ItemCode', ''))
+        item_name = item.get('ItemName', '')
+        current_price = old_prices[i]
+
+        if progress_callback:
+            progress_callback(i + 1, total, item_code, item_name, current_price)
+
+        description, sku = extract_sku_from_name(item_name)
+        if not sku:
+            errors.append({
+                'ItemCode': item_code,
+                'ItemName': item_name,
+                'CurrentPrice': current_price,
+                'Error': 'Price not found'
+            })
+            continue
+
+        website = determine_website(sku)
+        source = 'JustKampers' if website == 'justkampers' else 'Heritage Parts Centre'
+        url = f"https://example.test/{website}/{sku}"
+        new_price = float(simulated[i])
+
+        price_diff = new_price - current_price
+        price_diff_pct = (price_diff / current_price * 100) if current_price > 0 else 0
+
+        if abs(price_diff) > 0.01:
+            updates.append({
+                'ItemCode': item_code,
+                'ItemName': item_name,
+                'OldPrice': current_price,
+                'NewPrice': new_price,
+                'Difference': price_diff,
+                'DifferencePercent': price_diff_pct,
+                'Source': source,
+                'URL': url
+            })
+            item['SalesUnitPrice'] = str(new_price)
+        else:
+            unchanged.append({
+                'ItemCode': item_code,
+                'ItemName': item_name,
+                'Price': current_price,
+                'Source': source,
+                'URL': url
+            })
+
+    # Write the updated CSV for Xero import
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        if items:
+            writer = csv.DictWriter(f, fieldnames=list(items[0].keys()))
+            writer.writeheader()
+            writer.writerows(items)
+
+    # Write the update report
+    with open(report_file, 'w', encoding='utf-8') as f:
+        f.write(f"Price Update Report (TEST MODE) - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write("=" * 80 + "\n\n")
+        f.write(f"Summary:\n")
+        f.write(f"Total items processed: {total}\n")
+        f.write(f"Prices updated: {len(updates)}\n")
+        f.write(f"Prices unchanged: {len(unchanged)}\n")
+        f.write(f"Errors: {len(errors)}\n")
+
+    return updates, errors, unchanged
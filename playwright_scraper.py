@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Playwright-based scraper for JustKampers and Heritage Parts Centre
+Async alternative to the Selenium PartsPriceScraper - one shared headless
+browser drives many pages concurrently instead of one driver per lookup
+Enable in the web app with USE_PLAYWRIGHT=1
+"""
+
+import asyncio
+import re
+import threading
+from typing import Optional, Tuple
+
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+
+from xero_price_updater import PartsPriceScraper, _norm_sku
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Cap on concurrent pages sharing the one browser
+MAX_CONCURRENT_PAGES = 10
+
+# Reuse the Selenium scraper's SKU parsing/routing (never starts a driver)
+_sku_parser = PartsPriceScraper(headless=True)
+
+
+class AsyncPartsPriceScraper:
+    """Async scraper driving a single shared Playwright browser"""
+
+    def __init__(self, headless: bool = True):
+        self.headless = headless
+        self._playwright = None
+        self._browser = None
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+    async def start(self):
+        """Launch the shared browser"""
+        if not self._browser:
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=self.headless)
+
+    async def close(self):
+        """Shut down the browser and Playwright"""
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _extract_price(self, page, container) -> Optional[float]:
+        """Pull a price out of a search-result product block"""
+        price_selectors = [
+            "span.price-wrapper[data-price-including-tax] span.price",
+            "span[data-price-type='finalPrice']",
+            "div.price-box span.price",
+            "span.price-wrapper span.price",
+            "span.price",
+        ]
+        for selector in price_selectors:
+            element = await container.query_selector(selector)
+            if not element:
+                continue
+            price_amount = await element.get_attribute('data-price-amount')
+            if price_amount:
+                return float(price_amount)
+            price_text = await element.text_content()
+            if price_text:
+                price_match = re.search(r'[\d,]+\.?\d*', price_text)
+                if price_match:
+                    return float(price_match.group().replace(',', ''))
+        return None
+
+    async def search_justkampers(self, sku: str) -> Tuple[Optional[float], Optional[str]]:
+        """
+        Search for a part on JustKampers.com
+        Returns (price, product_url) if found, (None, None) otherwise
+        """
+        search_sku = sku.strip()
+        search_url = f"https://www.justkampers.com/catalogsearch/result/?q={search_sku}"
+        async with self._semaphore:
+            page = await self._browser.new_page()
+            try:
+                logger.info(f"Searching JustKampers for SKU: {search_sku}")
+                await page.goto(search_url, wait_until='domcontentloaded', timeout=15000)
+
+                products = await page.query_selector_all("div.product-item")
+                for product in products:
+                    label = await product.query_selector("div.amlabel-text")
+                    if not label:
+                        continue
+                    product_sku = (await label.text_content() or '').strip()
+                    if _norm_sku(product_sku) != _norm_sku(search_sku):
+                        continue
+
+                    price = await self._extract_price(page, product)
+                    if price is not None:
+                        link = await product.query_selector("a.product-item-photo, a.product-item-link")
+                        product_url = await link.get_attribute('href') if link else page.url
+                        logger.info(f"Found price £{price} for {search_sku} on JustKampers")
+                        return price, product_url
+
+                logger.warning(f"No exact match found for {search_sku} on JustKampers")
+                return None, None
+            except PlaywrightTimeoutError:
+                logger.warning(f"Timeout searching JustKampers for {search_sku}")
+                return None, None
+            except Exception as e:
+                logger.error(f"Error searching JustKampers for {search_sku}: {e}")
+                return None, None
+            finally:
+                await page.close()
+
+    async def search_heritage(self, sku: str) -> Tuple[Optional[float], Optional[str]]:
+        """
+        Search for a part on Heritage Parts Centre
+        Returns (price, product_url) if found, (None, None) otherwise
+        """
+        search_sku = sku.strip().rstrip('/')
+        search_sku_normalized = _norm_sku(search_sku)
+        search_url = f"https://www.heritagepartscentre.com/uk/catalogsearch/result/?q={search_sku}"
+        async with self._semaphore:
+            page = await self._browser.new_page()
+            try:
+                logger.info(f"Searching Heritage for SKU: {search_sku}")
+                await page.goto(search_url, wait_until='domcontentloaded', timeout=20000)
+
+                try:
+                    await page.wait_for_selector("div.products-grid", timeout=10000)
+                except PlaywrightTimeoutError:
+                    logger.warning(f"No search results found for {search_sku} on Heritage")
+                    return None, None
+
+                products = await page.query_selector_all("div.product-item-info")
+                if not products:
+                    products = await page.query_selector_all("li.product-item")
+
+                for product in products:
+                    sku_element = await product.query_selector(
+                        "div.product__sku mark, div.product-item-sku, span.sku, span[itemprop='sku']"
+                    )
+                    if not sku_element:
+                        continue
+                    product_sku = (await sku_element.text_content() or '').strip()
+                    product_sku_normalized = _norm_sku(product_sku)
+                    if product_sku_normalized != search_sku_normalized:
+                        continue
+
+                    price = await self._extract_price(page, product)
+                    if price is not None and price > 0:
+                        link = await product.query_selector("a.product-item-link")
+                        product_url = await link.get_attribute('href') if link else page.url
+                        logger.info(f"Found price £{price} for {search_sku} on Heritage")
+                        return price, product_url
+
+                logger.warning(f"No exact match found for {search_sku} on Heritage")
+                return None, None
+            except Exception as e:
+                logger.error(f"Error searching Heritage for {sku}: {e}")
+                return None, None
+            finally:
+                await page.close()
+
+    async def get_price(self, item_name: str) -> Tuple[Optional[float], str, Optional[str]]:
+        """
+        Get price for an item based on its name and SKU
+        Returns: (price, source_website, product_url)
+        """
+        description, sku = _sku_parser.extract_sku_from_name(item_name)
+
+        if not sku:
+            logger.warning(f"No SKU found in item name: {item_name}")
+            return None, "unknown", None
+
+        website = _sku_parser.determine_website(sku)
+
+        if website == 'justkampers':
+            price, url = await self.search_justkampers(sku)
+            return price, 'JustKampers', url
+        else:
+            price, url = await self.search_heritage(sku)
+            return price, 'Heritage Parts Centre', url
+
+
+class PlaywrightPriceScraper:
+    """
+    Sync facade over AsyncPartsPriceScraper with the same interface as
+    PartsPriceScraper, so web_app can swap it in without going async
+    Calls from multiple threads share one event loop and one browser
+    """
+
+    def __init__(self, headless: bool = True):
+        self._scraper = AsyncPartsPriceScraper(headless=headless)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self._run(self._scraper.start())
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def get_price(self, item_name: str) -> Tuple[Optional[float], str, Optional[str]]:
+        """Get price for an item - blocking wrapper over the async scraper"""
+        return self._run(self._scraper.get_price(item_name))
+
+    def close_driver(self):
+        """Close the browser and stop the event loop"""
+        self._run(self._scraper.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
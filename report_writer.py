@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Report writer for the web interface
+Takes a plain columnar payload (picklable) so it can run in a worker
+process without dragging the Flask app into the child
+"""
+
+from datetime import datetime
+
+try:
+    import numpy as np  # vectorized sort for large reports, optional
+except ImportError:
+    np = None
+
+
+def write_report(filepath, payload):
+    """Write the update report from a ScraperTask.report_payload() dict"""
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(f"Price Update Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write("=" * 80 + "\n\n")
+
+        updates_count = len(payload['update_codes'])
+        errors_count = len(payload['error_codes'])
+
+        f.write(f"Summary:\n")
+        f.write(f"Total items processed: {payload['processed_items']}\n")
+        f.write(f"Prices updated: {updates_count}\n")
+        f.write(f"Prices unchanged: {payload['unchanged_count']}\n")
+        f.write(f"Errors: {errors_count}\n\n")
+
+        if updates_count:
+            f.write("PRICE UPDATES:\n")
+            f.write("-" * 80 + "\n")
+            # Sort indices by magnitude of change, then read the columns;
+            # the diff column is a contiguous array('d'), so numpy argsorts
+            # it without a per-element Python key call
+            diff_pct = payload['update_diff_pct']
+            if np is not None:
+                order = np.argsort(-np.abs(np.asarray(diff_pct)), kind='stable')
+            else:
+                order = sorted(range(updates_count), key=lambda i: abs(diff_pct[i]), reverse=True)
+            for i in order:
+                f.write(f"\n{payload['update_codes'][i]}: {payload['update_names'][i]}\n")
+                f.write(f"  Source: {payload['update_sources'][i]}\n")
+                f.write(f"  Old Price: £{payload['update_old'][i]:.2f}\n")
+                f.write(f"  New Price: £{payload['update_new'][i]:.2f}\n")
+                f.write(f"  Difference: £{payload['update_diff'][i]:+.2f} ({diff_pct[i]:+.1f}%)\n")
+
+        if errors_count:
+            f.write("\n\nERRORS:\n")
+            f.write("-" * 80 + "\n")
+            for i in range(errors_count):
+                f.write(f"\n{payload['error_codes'][i]}: {payload['error_names'][i]}\n")
+                f.write(f"  Current Price: £{payload['error_prices'][i]:.2f}\n")
+                f.write(f"  Error: {payload['error_messages'][i]}\n")
+                if payload['error_sources'][i]:
+                    f.write(f"  Source: {payload['error_sources'][i]}\n")
+                if payload['error_urls'][i]:
+                    f.write(f"  URL: {payload['error_urls'][i]}\n")
@@ -106,23 +106,43 @@ socket.on('status_update', (data) => {
     updateProgress(data);
 });
 
-socket.on('item_processing', (data) => {
-    document.getElementById('currentItem').textContent = `${data.item_code}: ${data.item_name}`;
-    addLogEntry(`Processing: ${data.item_code}`, 'info');
-});
+// Per-item handlers - the server batches these into 'items_batch' frames
+const itemHandlers = {
+    item_processing: (data) => {
+        document.getElementById('currentItem').textContent = `${data.item_code}: ${data.item_name}`;
+        addLogEntry(`Processing: ${data.item_code}`, 'info');
+    },
+    item_updated: (data) => {
+        addToUpdatesTable(data);
+        addLogEntry(`✅ Updated: ${data.item_code} - £${data.old_price.toFixed(2)} → £${data.new_price.toFixed(2)}`, 'success');
+    },
+    item_unchanged: (data) => {
+        addToUnchangedTable(data);
+    },
+    item_error: (data) => {
+        addToErrorsTable(data);
+        addLogEntry(`❌ Error: ${data.item_code} - ${data.error}`, 'error');
+    }
+};
 
-socket.on('item_updated', (data) => {
-    addToUpdatesTable(data);
-    addLogEntry(`✅ Updated: ${data.item_code} - £${data.old_price.toFixed(2)} → £${data.new_price.toFixed(2)}`, 'success');
-});
+function handleBatch(batch) {
+    batch.forEach((msg) => {
+        const handler = itemHandlers[msg.event];
+        if (handler) handler(msg.data);
+    });
+}
+
+socket.on('items_batch', handleBatch);
 
-socket.on('item_unchanged', (data) => {
-    addToUnchangedTable(data);
+// Large batches arrive zstd-compressed (decompressed with fzstd)
+socket.on('items_batch_zstd', (payload) => {
+    const bytes = fzstd.decompress(new Uint8Array(payload));
+    handleBatch(JSON.parse(new TextDecoder().decode(bytes)));
 });
 
-socket.on('item_error', (data) => {
-    addToErrorsTable(data);
-    addLogEntry(`❌ Error: ${data.item_code} - ${data.error}`, 'error');
+// Keep single-event handlers for backwards compatibility
+Object.entries(itemHandlers).forEach(([event, handler]) => {
+    socket.on(event, handler);
 });
 
 socket.on('processing_complete', (data) => {
@@ -4,20 +4,71 @@ Interactive Web Interface for Xero Price Updater
 Real-time progress tracking for price scraping
 """
 
-from flask import Flask, render_template, request, jsonify, send_file
+# Monkey-patch before anything else touches sockets/threads: with eventlet,
+# Socket.IO emits from background tasks stream immediately instead of
+# buffering until the worker yields
+try:
+    import eventlet
+    eventlet.monkey_patch()
+except ImportError:
+    eventlet = None
+
+from flask import Flask, render_template, request, jsonify, send_file, Response
 from flask_socketio import SocketIO, emit
+import atexit
 import csv
 import os
+import queue
+import shutil
 import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from xero_price_updater import PartsPriceScraper
 import fast_scraper  # For testing mode
+import report_writer
 import logging
 import json
 
+try:
+    import pyarrow as pa  # SIMD-accelerated CSV parsing, optional
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+try:
+    import diskcache  # persistent price cache, optional
+except ImportError:
+    diskcache = None
+
+try:
+    import orjson  # faster JSON for the Socket.IO emit path, optional
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard  # compressed batch emits, optional
+except ImportError:
+    zstandard = None
+
+
+class OrJSON:
+    """json-module shim so Socket.IO serializes payloads with orjson"""
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(data, **kwargs):
+        return orjson.loads(data)
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your-secret-key-here'
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(app, cors_allowed_origins="*",
+                    async_mode='eventlet' if eventlet else 'threading',
+                    json=OrJSON if orjson else json)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -25,32 +76,364 @@ logger = logging.getLogger(__name__)
 
 # Global variables for tracking progress
 current_task = None
-scraper_instance = None
+
+# Number of concurrent scraper threads (each gets its own Chrome driver)
+SCRAPER_WORKERS = int(os.environ.get('SCRAPER_WORKERS', '4'))
+
+# Set USE_X_ACCEL=1 when running behind nginx with an internal /outputs/
+# location so downloads are served by kernel sendfile instead of Python
+USE_X_ACCEL = os.environ.get('USE_X_ACCEL', '0') == '1'
+
+# Set USE_PLAYWRIGHT=1 to drive one shared Playwright browser instead of
+# per-worker Selenium drivers (needs `pip install playwright && playwright install chromium`)
+USE_PLAYWRIGHT = os.environ.get('USE_PLAYWRIGHT', '0') == '1'
+
+# Per-thread scraper pool - drivers persist across runs so the ~1-2s
+# Chrome startup amortizes over the whole session, not per upload
+_tls = threading.local()
+_all_scrapers = []
+_scrapers_lock = threading.Lock()
+
+# The worker pool is a process-wide singleton: thread-local drivers live
+# and die with their threads, so the threads themselves must survive
+# across runs for the drivers to be reused at all
+_scraper_executor = None
+_scraper_executor_lock = threading.Lock()
+
+def _get_scraper_executor():
+    global _scraper_executor
+    with _scraper_executor_lock:
+        if _scraper_executor is None:
+            _scraper_executor = ThreadPoolExecutor(max_workers=SCRAPER_WORKERS)
+        return _scraper_executor
+
+def get_scraper():
+    """Return this thread's scraper, creating it lazily on first use"""
+    if USE_PLAYWRIGHT:
+        # One shared browser; the facade is safe to call from any thread
+        with _scrapers_lock:
+            if not _all_scrapers:
+                from playwright_scraper import PlaywrightPriceScraper
+                _all_scrapers.append(PlaywrightPriceScraper(headless=True))
+            return _all_scrapers[0]
+    scraper = getattr(_tls, 'scraper', None)
+    if scraper is None:
+        scraper = PartsPriceScraper(headless=True)
+        _tls.scraper = scraper
+        with _scrapers_lock:
+            _all_scrapers.append(scraper)
+    return scraper
+
+def _close_all_scrapers():
+    """Shut down every pooled driver at process exit"""
+    with _scrapers_lock:
+        for scraper in _all_scrapers:
+            try:
+                scraper.close_driver()
+            except Exception:
+                pass
+        _all_scrapers.clear()
+
+atexit.register(_close_all_scrapers)
+
+class EmitBatcher:
+    """
+    Coalesces per-row Socket.IO traffic: item events are buffered and sent
+    as one 'items_batch' frame, and only the latest status_update payload
+    is kept, flushed every FLUSH_INTERVAL seconds or FLUSH_ROWS items
+    """
+    FLUSH_INTERVAL = 0.25
+    FLUSH_ROWS = 50
+    # Compress batches at least this long - repeated source names and URL
+    # prefixes make them highly compressible
+    COMPRESS_MIN_ROWS = 20
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items = []
+        self._status = None
+        self._running = False
+
+    def start(self):
+        """Start the background flush loop (idempotent)"""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+        socketio.start_background_task(self._flush_loop)
+
+    def stop(self):
+        """Stop the flush loop and push out anything still buffered"""
+        with self._lock:
+            self._running = False
+        self.flush()
+
+    def item(self, event, payload):
+        """Queue a per-item event ('item_updated', 'item_error', ...)"""
+        with self._lock:
+            self._items.append({'event': event, 'data': payload})
+            should_flush = len(self._items) >= self.FLUSH_ROWS
+        if should_flush:
+            self.flush()
+
+    def status(self, payload):
+        """Record the latest status snapshot - intermediate ones are dropped"""
+        with self._lock:
+            self._status = payload
+
+    def flush(self):
+        with self._lock:
+            items, self._items = self._items, []
+            status, self._status = self._status, None
+        if items:
+            compressed = self._compress(items)
+            if compressed is not None:
+                socketio.emit('items_batch_zstd', compressed)
+            else:
+                socketio.emit('items_batch', items)
+            sse_broadcast('items_batch', items)
+        if status:
+            socketio.emit('status_update', status)
+            sse_broadcast('status_update', status)
+
+    @staticmethod
+    def _compress(items):
+        """zstd-compressed JSON for big batches, or None to send plain"""
+        if zstandard is None or len(items) < EmitBatcher.COMPRESS_MIN_ROWS:
+            return None
+        payload = orjson.dumps(items) if orjson else json.dumps(items).encode()
+        return zstandard.ZstdCompressor(level=3).compress(payload)
+
+    def _flush_loop(self):
+        while True:
+            socketio.sleep(self.FLUSH_INTERVAL)
+            self.flush()
+            with self._lock:
+                if not self._running and not self._items and self._status is None:
+                    break
+
+emit_batcher = EmitBatcher()
+
+# Report formatting is CPU-bound (sorting + f-strings); a single-worker
+# process pool keeps it off the scraping thread and outside the GIL
+_report_pool = None
+_report_pool_lock = threading.Lock()
+
+def _get_report_pool():
+    global _report_pool
+    with _report_pool_lock:
+        if _report_pool is None:
+            _report_pool = ProcessPoolExecutor(max_workers=1)
+        return _report_pool
+
+# Server-Sent Events subscribers - progress is one-way, so clients can
+# follow a bare HTTP stream instead of (or as well as) Socket.IO
+_sse_subscribers = []
+_sse_lock = threading.Lock()
+
+def sse_broadcast(event, data):
+    """Queue a message for every connected SSE client"""
+    message = json.dumps({'event': event, 'data': data})
+    with _sse_lock:
+        for subscriber in _sse_subscribers:
+            try:
+                subscriber.put_nowait(message)
+            except queue.Full:
+                pass  # slow client - drop rather than stall the scraper
+
+# Rows that can never resolve to a part price - filtered before any
+# network work. Extend these tables as new non-part codes show up.
+SKIP_ITEM_CODE_PREFIXES = ('SHIP', 'SERV', 'ADMIN')
+MIN_ITEM_NAME_LENGTH = 3
+
+def should_skip_item(item_code, item_name):
+    """True for rows not worth a scrape (blank names, services, shipping)"""
+    if not item_name or len(item_name) < MIN_ITEM_NAME_LENGTH:
+        return True
+    return item_code.startswith(SKIP_ITEM_CODE_PREFIXES)
+
+# Price lookups are cached per item name: a dict memoizes within a
+# single run (duplicate SKUs across rows are free; cleared when the next
+# run starts) and diskcache persists results across runs for
+# PRICE_CACHE_TTL seconds
+PRICE_CACHE_TTL = 6 * 3600
+_price_cache = diskcache.Cache('cache/prices') if diskcache else None
+_run_cache = {}
+_run_cache_lock = threading.Lock()
+
+def lookup_price(item_name):
+    """Get (price, source, url) for an item, going to the network only on a cache miss"""
+    with _run_cache_lock:
+        cached = _run_cache.get(item_name)
+    if cached is not None:
+        return cached
+
+    if _price_cache is not None:
+        cached = _price_cache.get(item_name)
+        if cached is not None:
+            with _run_cache_lock:
+                _run_cache[item_name] = cached
+            return cached
+
+    # get_price is already HTTP-first internally (REST, then the search
+    # page, then Chrome) and keeps its own SKU-keyed disk cache, so one
+    # call covers the whole fallback chain without repeating the HTTP tier
+    result = get_scraper().get_price(item_name)
+
+    if result[0] is not None:
+        with _run_cache_lock:
+            _run_cache[item_name] = result
+        if _price_cache is not None:
+            _price_cache.set(item_name, result, expire=PRICE_CACHE_TTL)
+    return result
+
+def read_csv_rows(filepath):
+    """Read a CSV into a list of row dicts, via pyarrow when available"""
+    if pacsv is not None:
+        # Pin every column to string so values round-trip exactly as
+        # DictReader would give them - inferred types would strip leading
+        # zeros from ItemCodes and reformat prices ("12.50" -> "12.5")
+        with open(filepath, 'r', encoding='utf-8-sig') as f:
+            header = next(csv.reader(f), [])
+        if not header:
+            return []
+        column_types = {name: pa.string() for name in header}
+        # pyarrow may keep the BOM in the first column name; cover both
+        column_types['\ufeff' + header[0]] = pa.string()
+        table = pacsv.read_csv(
+            filepath,
+            read_options=pacsv.ReadOptions(block_size=1 << 20),
+            convert_options=pacsv.ConvertOptions(column_types=column_types,
+                                                 strings_can_be_null=False)
+        )
+        rows = table.to_pylist()
+        bom_keys = [name for name in table.column_names if name.startswith('\ufeff')]
+        for row in rows:
+            for key in bom_keys:
+                row[key.lstrip('\ufeff')] = row.pop(key)
+            for key, value in row.items():
+                if value is None:
+                    row[key] = ''
+        return rows
+    with open(filepath, 'r', encoding='utf-8-sig') as f:
+        return list(csv.DictReader(f))
 
 class ScraperTask:
+    """
+    Tracks one scraping run. Results are stored struct-of-arrays: parallel
+    columns (lists for strings, array('d') for prices) instead of one dict
+    per row, which keeps memory flat on multi-thousand-row CSVs
+    """
     def __init__(self):
         self.total_items = 0
         self.processed_items = 0
-        self.updates = []
-        self.errors = []
-        self.unchanged = []
+        # Updated items
+        self.update_codes = []
+        self.update_names = []
+        self.update_old = array('d')
+        self.update_new = array('d')
+        self.update_diff = array('d')
+        self.update_diff_pct = array('d')
+        self.update_sources = []
+        self.update_urls = []
+        # Items where the price couldn't be found
+        self.error_codes = []
+        self.error_names = []
+        self.error_prices = array('d')
+        self.error_messages = []
+        self.error_sources = []
+        self.error_urls = []
+        # Items whose price matched
+        self.unchanged_codes = []
+        self.unchanged_names = []
+        self.unchanged_prices = array('d')
+        self.unchanged_sources = []
+        self.unchanged_urls = []
         self.status = "idle"
         self.current_item = ""
         self.output_file = ""
         self.report_file = ""
-        
-    def to_dict(self):
+        # Memoized to_dict snapshot - rebuilt only when the key fields move
+        self._snapshot = None
+        self._snapshot_key = None
+
+    @property
+    def updates_count(self):
+        return len(self.update_codes)
+
+    @property
+    def errors_count(self):
+        return len(self.error_codes)
+
+    @property
+    def unchanged_count(self):
+        return len(self.unchanged_codes)
+
+    def add_update(self, result):
+        """Record an updated item from an emit-style result dict"""
+        self.update_codes.append(result['item_code'])
+        self.update_names.append(result['item_name'])
+        self.update_old.append(result['old_price'])
+        self.update_new.append(result['new_price'])
+        self.update_diff.append(result['difference'])
+        self.update_diff_pct.append(result['difference_percent'])
+        self.update_sources.append(result['source'])
+        self.update_urls.append(result.get('url'))
+
+    def add_error(self, result):
+        """Record a failed lookup from an emit-style result dict"""
+        self.error_codes.append(result['item_code'])
+        self.error_names.append(result['item_name'])
+        self.error_prices.append(result['current_price'])
+        self.error_messages.append(result['error'])
+        self.error_sources.append(result.get('source'))
+        self.error_urls.append(result.get('url'))
+
+    def add_unchanged(self, result):
+        """Record an unchanged item from an emit-style result dict"""
+        self.unchanged_codes.append(result['item_code'])
+        self.unchanged_names.append(result['item_name'])
+        self.unchanged_prices.append(result['old_price'])
+        self.unchanged_sources.append(result['source'])
+        self.unchanged_urls.append(result.get('url'))
+
+    def report_payload(self):
+        """Plain picklable dict of the columns the report writer needs"""
         return {
-            'total_items': self.total_items,
             'processed_items': self.processed_items,
-            'updates_count': len(self.updates),
-            'errors_count': len(self.errors),
-            'unchanged_count': len(self.unchanged),
-            'status': self.status,
-            'current_item': self.current_item,
-            'progress_percent': (self.processed_items / self.total_items * 100) if self.total_items > 0 else 0
+            'unchanged_count': self.unchanged_count,
+            'update_codes': self.update_codes,
+            'update_names': self.update_names,
+            'update_old': self.update_old,
+            'update_new': self.update_new,
+            'update_diff': self.update_diff,
+            'update_diff_pct': self.update_diff_pct,
+            'update_sources': self.update_sources,
+            'error_codes': self.error_codes,
+            'error_names': self.error_names,
+            'error_prices': self.error_prices,
+            'error_messages': self.error_messages,
+            'error_sources': self.error_sources,
+            'error_urls': self.error_urls,
         }
 
+    def to_dict(self):
+        key = (self.total_items, self.processed_items, self.updates_count,
+               self.errors_count, self.unchanged_count, self.status, self.current_item)
+        if self._snapshot is None or self._snapshot_key != key:
+            self._snapshot_key = key
+            self._snapshot = {
+                'total_items': self.total_items,
+                'processed_items': self.processed_items,
+                'updates_count': self.updates_count,
+                'errors_count': self.errors_count,
+                'unchanged_count': self.unchanged_count,
+                'status': self.status,
+                'current_item': self.current_item,
+                'progress_percent': (self.processed_items / self.total_items * 100) if self.total_items > 0 else 0
+            }
+        return self._snapshot
+
 @app.route('/')
 def index():
     """Main page with upload form and progress display"""
@@ -59,7 +442,7 @@ def index():
 @app.route('/upload', methods=['POST'])
 def upload_file():
     """Handle CSV file upload"""
-    global current_task, scraper_instance
+    global current_task
     
     if 'file' not in request.files:
         return jsonify({'error': 'No file uploaded'}), 400
@@ -71,23 +454,30 @@ def upload_file():
     if not file.filename.endswith('.csv'):
         return jsonify({'error': 'Please upload a CSV file'}), 400
     
-    # Save uploaded file
+    # Save uploaded file - stream in 1 MiB chunks instead of werkzeug's
+    # default small buffer to cut syscall overhead on big exports
     upload_path = os.path.join('uploads', file.filename)
     os.makedirs('uploads', exist_ok=True)
-    file.save(upload_path)
+    with open(upload_path, 'wb') as dst:
+        shutil.copyfileobj(file.stream, dst, 1 << 20)
+        if hasattr(os, 'posix_fadvise'):
+            # Hint the kernel we'll read this back sequentially
+            os.posix_fadvise(dst.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
     
     # Check if test mode is requested
     test_mode = request.form.get('test_mode', 'false') == 'true'
     
-    # Start processing in background
+    # Start processing in background; the run-scoped memo must not leak
+    # stale prices from earlier runs past the disk cache's TTL
+    with _run_cache_lock:
+        _run_cache.clear()
     current_task = ScraperTask()
     if test_mode:
         logger.info("Starting in TEST MODE with fast scraper")
-        thread = threading.Thread(target=process_csv_test, args=(upload_path,))
+        socketio.start_background_task(process_csv_test, upload_path)
     else:
         logger.info("Starting in PRODUCTION MODE with real scraper")
-        thread = threading.Thread(target=process_csv, args=(upload_path,))
-    thread.start()
+        socketio.start_background_task(process_csv, upload_path)
     
     return jsonify({'message': 'Processing started', 'filename': file.filename, 'mode': 'test' if test_mode else 'production'})
 
@@ -98,12 +488,10 @@ def process_csv_test(filepath):
     try:
         current_task.status = "processing"
         socketio.emit('status_update', current_task.to_dict())
-        
+
         # Read CSV
-        with open(filepath, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            items = list(reader)
-        
+        items = read_csv_rows(filepath)
+
         current_task.total_items = len(items)
         socketio.emit('status_update', current_task.to_dict())
         
@@ -112,15 +500,15 @@ def process_csv_test(filepath):
             current_task.current_item = f"{item_code}: {item_name}"
             current_task.processed_items = i
             
-            socketio.emit('item_processing', {
+            emit_batcher.item('item_processing', {
                 'item_code': item_code,
                 'item_name': item_name,
                 'current_price': current_price,
                 'index': i,
                 'total': total
             })
-            
-            socketio.emit('status_update', current_task.to_dict())
+
+            emit_batcher.status(current_task.to_dict())
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         output_file = f"outputs/xero_import_test_{timestamp}.csv"
@@ -131,9 +519,9 @@ def process_csv_test(filepath):
             filepath, output_file, report_file, progress_callback
         )
         
-        # Emit results
+        # Emit and record results
         for update in updates:
-            socketio.emit('item_updated', {
+            result = {
                 'item_code': update['ItemCode'],
                 'item_name': update['ItemName'],
                 'old_price': update['OldPrice'],
@@ -142,198 +530,300 @@ def process_csv_test(filepath):
                 'difference_percent': update['DifferencePercent'],
                 'source': update['Source'],
                 'url': update.get('URL')
-            })
-        
+            }
+            current_task.add_update(result)
+            emit_batcher.item('item_updated', result)
+
         for error in errors:
-            socketio.emit('item_error', {
+            result = {
                 'item_code': error['ItemCode'],
                 'item_name': error['ItemName'],
                 'current_price': error['CurrentPrice'],
                 'error': error['Error']
+            }
+            current_task.add_error(result)
+            emit_batcher.item('item_error', result)
+
+        for item in unchanged:
+            current_task.add_unchanged({
+                'item_code': item['ItemCode'],
+                'item_name': item['ItemName'],
+                'old_price': item['Price'],
+                'source': item['Source'],
+                'url': item.get('URL')
             })
-        
-        current_task.updates = updates
-        current_task.errors = errors
-        current_task.unchanged = unchanged
+
         current_task.status = "completed"
         current_task.output_file = os.path.basename(output_file)
         current_task.report_file = os.path.basename(report_file)
-        
-        socketio.emit('processing_complete', {
+
+        emit_batcher.stop()
+        complete = {
             'output_file': current_task.output_file,
             'report_file': current_task.report_file,
             'summary': current_task.to_dict()
-        })
-        
+        }
+        socketio.emit('processing_complete', complete)
+        sse_broadcast('processing_complete', complete)
+
     except Exception as e:
-        logger.error(f"Error in test processing: {e}")
+        logger.error("Error in test processing: %s", e)
         current_task.status = "error"
         socketio.emit('processing_error', {'error': str(e)})
+        sse_broadcast('processing_error', {'error': str(e)})
 
 def process_csv(filepath):
     """Process the CSV file and update prices"""
-    global current_task, scraper_instance
-    
-    try:
-        current_task.status = "processing"
-        socketio.emit('status_update', current_task.to_dict())
-        
-        # Read CSV
-        with open(filepath, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            items = list(reader)
-        
-        current_task.total_items = len(items)
-        socketio.emit('status_update', current_task.to_dict())
-        logger.info(f"Starting to process {current_task.total_items} items")
-        
-        # Initialize scraper
-        scraper_instance = PartsPriceScraper(headless=True)
-        
-        # Process each item
-        for i, item in enumerate(items, 1):
-            if current_task.status == "cancelled":
-                break
-                
-            item_code = item.get('ItemCode', item.get('*ItemCode', ''))
-            item_name = item.get('ItemName', '')
-            
-            # Handle empty or invalid price values
+    global current_task
+
+    results_lock = threading.Lock()
+    writer_lock = threading.Lock()
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    os.makedirs('outputs', exist_ok=True)
+    output_path = os.path.join('outputs', f"xero_import_{timestamp}.csv")
+    report_path = os.path.join('outputs', f"price_update_report_{timestamp}.txt")
+
+    # Completed rows stream straight to the output CSV (in completion
+    # order) so a crash or cancellation mid-run keeps the work done so far
+    out_state = {'file': None, 'writer': None, 'rows': 0}
+
+    def write_row(item):
+        with writer_lock:
+            if out_state['writer'] is None:
+                out_state['file'] = open(output_path, 'w', newline='', encoding='utf-8')
+                out_state['writer'] = csv.DictWriter(out_state['file'], fieldnames=list(item.keys()))
+                out_state['writer'].writeheader()
+            out_state['writer'].writerow(item)
+            out_state['rows'] += 1
+            if out_state['rows'] % 64 == 0:
+                out_state['file'].flush()
+            write_partial = out_state['rows'] % 100 == 0
+        if write_partial:
+            # Keep an up-to-date partial report alongside the CSV
             try:
-                price_str = item.get('SalesUnitPrice', '0').strip()
-                current_price = float(price_str) if price_str else 0.0
-            except (ValueError, AttributeError):
-                current_price = 0.0
-            
-            current_task.current_item = f"{item_code}: {item_name}"
-            current_task.processed_items = i
-            
-            logger.info(f"Processing item {i}/{current_task.total_items}: {item_name}")
-            
-            # Emit progress update
-            socketio.emit('item_processing', {
+                report_writer.write_report(report_path + '.partial', current_task.report_payload())
+            except Exception as e:
+                logger.debug("Partial report write failed: %s", e)
+
+    def scrape_item(item):
+        """Scrape one row and record the result (runs in a worker thread)"""
+        if current_task.status == "cancelled":
+            return
+
+        item_code = item.get('ItemCode', item.get('*ItemCode', ''))
+        item_name = item.get('ItemName', '')
+
+        # Handle empty or invalid price values
+        try:
+            price_str = item.get('SalesUnitPrice', '0').strip()
+            current_price = float(price_str) if price_str else 0.0
+        except (ValueError, AttributeError):
+            current_price = 0.0
+
+        # Short-circuit rows that can't have a price before paying for a
+        # scrape; they pass through to the output file unmodified
+        if should_skip_item(item_code, item_name):
+            result = {
                 'item_code': item_code,
                 'item_name': item_name,
-                'current_price': current_price,
-                'index': i,
-                'total': current_task.total_items
-            })
-            
-            # Get new price with timeout protection
-            try:
-                new_price, source, url = scraper_instance.get_price(item_name)
-            except Exception as e:
-                logger.error(f"Error getting price for {item_name}: {e}")
-                new_price = None
-                source = "error"
-                url = None
-            
-            if new_price is not None:
-                price_diff = new_price - current_price
-                price_diff_pct = (price_diff / current_price * 100) if current_price > 0 else 0
-                
-                result = {
-                    'item_code': item_code,
-                    'item_name': item_name,
-                    'old_price': current_price,
-                    'new_price': new_price,
-                    'difference': price_diff,
-                    'difference_percent': price_diff_pct,
-                    'source': source,  # Keep the source name
-                    'url': url  # Add URL as separate field
-                }
-                
-                if abs(price_diff) > 0.01:
-                    current_task.updates.append(result)
+                'old_price': current_price,
+                'new_price': current_price,
+                'difference': 0.0,
+                'difference_percent': 0.0,
+                'source': 'skipped',
+                'url': None
+            }
+            with results_lock:
+                current_task.add_unchanged(result)
+                current_task.processed_items += 1
+            emit_batcher.item('item_unchanged', result)
+            emit_batcher.status(current_task.to_dict())
+            write_row(item)
+            return
+
+        current_task.current_item = f"{item_code}: {item_name}"
+
+        # Emit progress update
+        emit_batcher.item('item_processing', {
+            'item_code': item_code,
+            'item_name': item_name,
+            'current_price': current_price,
+            'index': current_task.processed_items + 1,
+            'total': current_task.total_items
+        })
+
+        # Get new price with timeout protection
+        try:
+            new_price, source, url = lookup_price(item_name)
+        except Exception as e:
+            logger.error("Error getting price for %s: %s", item_name, e)
+            new_price = None
+            source = "error"
+            url = None
+
+        if new_price is not None:
+            price_diff = new_price - current_price
+            price_diff_pct = (price_diff / current_price * 100) if current_price > 0 else 0
+
+            result = {
+                'item_code': item_code,
+                'item_name': item_name,
+                'old_price': current_price,
+                'new_price': new_price,
+                'difference': price_diff,
+                'difference_percent': price_diff_pct,
+                'source': source,  # Keep the source name
+                'url': url  # Add URL as separate field
+            }
+
+            if abs(price_diff) > 0.01:
+                with results_lock:
+                    current_task.add_update(result)
                     item['SalesUnitPrice'] = str(new_price)
-                    socketio.emit('item_updated', result)
-                else:
-                    current_task.unchanged.append(result)
-                    socketio.emit('item_unchanged', result)
+                emit_batcher.item('item_updated', result)
             else:
-                error_result = {
-                    'item_code': item_code,
-                    'item_name': item_name,
-                    'current_price': current_price,
-                    'error': 'Price not found',
-                    'source': source,
-                    'url': url
-                }
-                current_task.errors.append(error_result)
-                socketio.emit('item_error', error_result)
-            
-            socketio.emit('status_update', current_task.to_dict())
-        
-        # Save results
+                with results_lock:
+                    current_task.add_unchanged(result)
+                emit_batcher.item('item_unchanged', result)
+        else:
+            error_result = {
+                'item_code': item_code,
+                'item_name': item_name,
+                'current_price': current_price,
+                'error': 'Price not found',
+                'source': source,
+                'url': url
+            }
+            with results_lock:
+                current_task.add_error(error_result)
+            emit_batcher.item('item_error', error_result)
+
+        with results_lock:
+            current_task.processed_items += 1
+        emit_batcher.status(current_task.to_dict())
+        write_row(item)
+
+    try:
+        current_task.status = "processing"
+        emit_batcher.start()
+        socketio.emit('status_update', current_task.to_dict())
+
+        # Cheap line count so the progress bar has a denominator before
+        # parsing finishes (header line excluded)
+        with open(filepath, 'rb') as f:
+            current_task.total_items = max(sum(1 for _ in f) - 1, 0)
+        socketio.emit('status_update', current_task.to_dict())
+        logger.info("Starting to process %d items with %d workers", current_task.total_items, SCRAPER_WORKERS)
+
+        # Stream rows through a bounded queue so scraping starts while the
+        # CSV is still being parsed; completed rows go straight to disk
+        row_queue = queue.Queue(maxsize=256)
+        _SENTINEL = object()
+
+        def produce_rows():
+            with open(filepath, 'r', encoding='utf-8-sig') as f:
+                for row in csv.DictReader(f):
+                    row_queue.put(row)
+            for _ in range(SCRAPER_WORKERS):
+                row_queue.put(_SENTINEL)
+
+        def consume_rows():
+            while True:
+                row = row_queue.get()
+                if row is _SENTINEL:
+                    break
+                scrape_item(row)
+
+        producer = threading.Thread(target=produce_rows, daemon=True)
+        producer.start()
+
+        executor = _get_scraper_executor()
+        futures = [executor.submit(consume_rows) for _ in range(SCRAPER_WORKERS)]
+        for future in as_completed(futures):
+            # Surface any unexpected worker failure rather than losing it
+            exc = future.exception()
+            if exc:
+                logger.error("Worker error: %s", exc)
+        producer.join()
+        emit_batcher.stop()
+
+        if out_state['file'] is not None:
+            out_state['file'].close()
+
+        # Finalize results
         if current_task.status != "cancelled":
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            current_task.output_file = f"xero_import_{timestamp}.csv"
-            current_task.report_file = f"price_update_report_{timestamp}.txt"
-            
-            # Write updated CSV
-            output_path = os.path.join('outputs', current_task.output_file)
-            os.makedirs('outputs', exist_ok=True)
-            
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                fieldnames = list(items[0].keys())
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(items)
-            
-            # Write report
-            report_path = os.path.join('outputs', current_task.report_file)
-            write_report(report_path, current_task)
-            
-            current_task.status = "completed"
-            socketio.emit('processing_complete', {
-                'output_file': current_task.output_file,
-                'report_file': current_task.report_file,
-                'summary': current_task.to_dict()
-            })
-        
+            current_task.output_file = os.path.basename(output_path)
+            current_task.report_file = os.path.basename(report_path)
+
+            def finish_run(future=None):
+                if future is not None and future.exception():
+                    logger.error("Report write failed, retrying inline: %s",
+                                 future.exception())
+                    try:
+                        report_writer.write_report(report_path, payload)
+                    except Exception as e:
+                        # No final report landed - keep the .partial
+                        # snapshot and report the failure, don't advertise
+                        # a download that will 404
+                        logger.error("Inline report write failed: %s", e)
+                        current_task.status = "error"
+                        error = {'error': f'Report write failed: {e}'}
+                        socketio.emit('processing_error', error)
+                        sse_broadcast('processing_error', error)
+                        return
+                partial_path = report_path + '.partial'
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+
+                current_task.status = "completed"
+                complete = {
+                    'output_file': current_task.output_file,
+                    'report_file': current_task.report_file,
+                    'summary': current_task.to_dict()
+                }
+                socketio.emit('processing_complete', complete)
+                sse_broadcast('processing_complete', complete)
+
+            # Format the report in the worker process; the 'complete' event
+            # fires from the done-callback as soon as it lands on disk
+            payload = current_task.report_payload()
+            try:
+                _get_report_pool().submit(
+                    report_writer.write_report, report_path, payload
+                ).add_done_callback(finish_run)
+            except Exception as e:
+                logger.error("Report pool unavailable, writing inline: %s", e)
+                report_writer.write_report(report_path, payload)
+                finish_run()
+
     except Exception as e:
-        logger.error(f"Error processing CSV: {e}")
+        logger.error("Error processing CSV: %s", e)
         current_task.status = "error"
         socketio.emit('processing_error', {'error': str(e)})
-    
-    finally:
-        if scraper_instance:
-            scraper_instance.close_driver()
-            scraper_instance = None
-
-def write_report(filepath, task):
-    """Write the update report"""
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(f"Price Update Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("=" * 80 + "\n\n")
-        
-        f.write(f"Summary:\n")
-        f.write(f"Total items processed: {task.processed_items}\n")
-        f.write(f"Prices updated: {len(task.updates)}\n")
-        f.write(f"Prices unchanged: {len(task.unchanged)}\n")
-        f.write(f"Errors: {len(task.errors)}\n\n")
-        
-        if task.updates:
-            f.write("PRICE UPDATES:\n")
-            f.write("-" * 80 + "\n")
-            for update in sorted(task.updates, key=lambda x: abs(x['difference_percent']), reverse=True):
-                f.write(f"\n{update['item_code']}: {update['item_name']}\n")
-                f.write(f"  Source: {update['source']}\n")
-                f.write(f"  Old Price: £{update['old_price']:.2f}\n")
-                f.write(f"  New Price: £{update['new_price']:.2f}\n")
-                f.write(f"  Difference: £{update['difference']:+.2f} ({update['difference_percent']:+.1f}%)\n")
-        
-        if task.errors:
-            f.write("\n\nERRORS:\n")
-            f.write("-" * 80 + "\n")
-            for error in task.errors:
-                f.write(f"\n{error['item_code']}: {error['item_name']}\n")
-                f.write(f"  Current Price: £{error['current_price']:.2f}\n")
-                f.write(f"  Error: {error['error']}\n")
-                if error.get('source'):
-                    f.write(f"  Source: {error['source']}\n")
-                if error.get('url'):
-                    f.write(f"  URL: {error['url']}\n")
+        sse_broadcast('processing_error', {'error': str(e)})
+
+@app.route('/progress')
+def progress_stream():
+    """Stream progress as Server-Sent Events (one-way alternative to Socket.IO)"""
+    def stream():
+        subscriber = queue.Queue(maxsize=1000)
+        with _sse_lock:
+            _sse_subscribers.append(subscriber)
+        try:
+            if current_task:
+                yield f"data: {json.dumps({'event': 'status_update', 'data': current_task.to_dict()})}\n\n"
+            while True:
+                try:
+                    message = subscriber.get(timeout=30)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"data: {message}\n\n"
+        finally:
+            with _sse_lock:
+                _sse_subscribers.remove(subscriber)
+    return Response(stream(), mimetype='text/event-stream')
 
 @app.route('/status')
 def get_status():
@@ -356,9 +846,17 @@ def cancel_processing():
 def download_file(filename):
     """Download result files"""
     filepath = os.path.join('outputs', filename)
-    if os.path.exists(filepath):
-        return send_file(filepath, as_attachment=True)
-    return jsonify({'error': 'File not found'}), 404
+    if not os.path.exists(filepath):
+        return jsonify({'error': 'File not found'}), 404
+    if USE_X_ACCEL:
+        # Hand the transfer off to nginx (zero-copy sendfile); requires an
+        # `internal` location mapping /outputs/ to the outputs directory
+        return Response(headers={
+            'X-Accel-Redirect': f'/outputs/{filename}',
+            'Content-Disposition': f'attachment; filename={filename}'
+        })
+    # conditional=True enables Range requests and 304s in dev
+    return send_file(filepath, as_attachment=True, conditional=True)
 
 @socketio.on('connect')
 def handle_connect():
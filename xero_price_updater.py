@@ -5,11 +5,39 @@ Scrapes prices from JustKampers.com and Heritage Parts Centre
 Updates prices in Xero export CSV file
 """
 
+import asyncio
+import atexit
 import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+import json
 import time
 import re
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
+import requests
+from bs4 import BeautifulSoup
+
+try:
+    import aiohttp  # concurrent fast-path fetches, optional
+except ImportError:
+    aiohttp = None
+
+try:
+    import diskcache  # persistent SKU->price cache, optional
+except ImportError:
+    diskcache = None
+
+try:
+    from aiolimiter import AsyncLimiter  # per-host request pacing, optional
+except ImportError:
+    AsyncLimiter = None
+
+try:
+    from lxml import html as lxml_html  # one-pass search page indexing, optional
+except ImportError:
+    lxml_html = None
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -28,24 +56,536 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session for the no-browser fast path: one keep-alive pool
+# per host, sized for the concurrent worker threads, so the TCP+TLS
+# handshake is paid once per site rather than per SKU
+_HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Accept-Language': 'en-GB,en;q=0.9',
+}
+_http_session = requests.Session()
+_http_session.headers.update(_HTTP_HEADERS)
+_http_adapter = requests.adapters.HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=requests.adapters.Retry(total=2, backoff_factor=0.5,
+                                        status_forcelist=(502, 503, 504)),
+)
+_http_session.mount('https://', _http_adapter)
+_http_session.mount('http://', _http_adapter)
+atexit.register(_http_session.close)
+
+# On-disk SKU->price cache: daily price refreshes re-run over a mostly
+# unchanged catalog, so yesterday's hits are free today. Misses are
+# cached too (shorter TTL) to stop re-hammering dead SKUs every run.
+PRICE_CACHE_TTL = 24 * 3600
+NEGATIVE_CACHE_TTL = 3600
+_price_cache = diskcache.Cache('.xero_price_cache', size_limit=100 * 1024 * 1024) if diskcache else None
+
+
+def extract_sku_from_name(item_name: str) -> Tuple[str, str]:
+    """
+    Extract SKU and description from item name
+    Returns: (description, sku)
+    """
+    # Split by last space to separate SKU from description
+    parts = item_name.rsplit(' ', 1)
+    if len(parts) == 2:
+        description, sku = parts
+        # Clean up SKU - remove trailing slashes and spaces
+        sku = sku.strip().rstrip('/')
+        return description.strip(), sku
+    return item_name, ""
+
+
+# SKU-prefix routing compiled into a single regex: the group name that
+# matches is the site, so adding a vendor is one alternation, not another
+# startswith branch. Anything unmatched falls through to Heritage.
+_ROUTE_RE = re.compile(r'^(?P<justkampers>J)')
+_DEFAULT_SITE = 'heritage'
+
+# Compiled once: this runs inside the products x selectors scraping loops
+_PRICE_RE = re.compile(r'[\d,]+\.?\d*')
+
+
+def determine_website(sku: str) -> str:
+    """Determine which website to search based on SKU prefix"""
+    match = _ROUTE_RE.match(sku)
+    return match.lastgroup if match else _DEFAULT_SITE
+
+
+# Single-pass SKU normalization for comparisons: one translate call
+# instead of chained .replace() allocations in the per-product loops.
+# Separators the sites format inconsistently (spaces, slashes, dashes,
+# dots) are all stripped
+_SKU_STRIP = str.maketrans('', '', ' /-.')
+
+
+def _norm_sku(sku: str) -> str:
+    """Normalize a SKU for comparison - strip separators, uppercase"""
+    return sku.strip().translate(_SKU_STRIP).upper()
+
+
+def _price_from_product_page(soup: BeautifulSoup) -> Optional[float]:
+    """Pull a price from product-page metadata (Open Graph or JSON-LD)"""
+    meta = soup.select_one("meta[property='product:price:amount']")
+    if meta and meta.get('content'):
+        try:
+            return float(meta['content'])
+        except ValueError:
+            pass
+
+    for script in soup.select("script[type='application/ld+json']"):
+        try:
+            data = json.loads(script.string or '')
+        except (ValueError, TypeError):
+            continue
+        for block in data if isinstance(data, list) else [data]:
+            offers = block.get('offers') if isinstance(block, dict) else None
+            if isinstance(offers, list):
+                offers = offers[0] if offers else None
+            if isinstance(offers, dict) and offers.get('price'):
+                try:
+                    return float(offers['price'])
+                except (ValueError, TypeError):
+                    continue
+    return None
+
+
+def _price_from_listing(product) -> Optional[float]:
+    """Pull a price from a search-result product block"""
+    price_element = product.select_one("span.price-wrapper[data-price-including-tax], span[data-price-amount]")
+    if price_element:
+        for attr in ('data-price-including-tax', 'data-price-amount'):
+            value = price_element.get(attr)
+            if value:
+                try:
+                    return float(value)
+                except ValueError:
+                    pass
+
+    price_element = product.select_one("span.price")
+    if price_element:
+        price_match = _PRICE_RE.search(price_element.get_text())
+        if price_match:
+            price = float(price_match.group().replace(',', ''))
+            if price > 0:
+                return price
+    return None
+
+
+# Selector fallback chains for the Selenium scrapers, hoisted to module
+# scope so the per-product loops don't rebuild them on every iteration
+_JK_PRICE_SELECTORS = (
+    "span.price",
+    "span[data-price-type='finalPrice']",
+    "div.price-box span.price",
+    "span.price-wrapper span.price",
+)
+_HER_SKU_SELECTORS = (
+    "div.product__sku mark",  # This is what Heritage uses
+    "div.product-item-sku",
+    "span.sku",
+    "div.sku",
+    "span[itemprop='sku']",
+)
+_HER_PRICE_SELECTORS = (
+    "span.price-wrapper[data-price-including-tax] span.price",  # Heritage's exact selector
+    "span[itemprop='lowPrice']",  # Alternative Heritage selector
+    "span.price:not(:empty)",
+    "span[data-price-type='finalPrice'] span.price",
+    "div.price-box span[data-price-amount]",
+    "span.price-wrapper span.price",
+    "div.price-final_price span.price",
+    "span.regular-price span.price",
+)
+
+# Per-site search-page settings for the HTTP fast path
+_SITE_CONFIG = {
+    'justkampers': {
+        'search_url': 'https://www.justkampers.com/catalogsearch/result/?q={sku}',
+        'rest_url': 'https://www.justkampers.com/rest/V1/products',
+        'product_css': 'div.product-item',
+        'sku_css': 'div.amlabel-text',
+        'source': 'JustKampers',
+    },
+    'heritage': {
+        'search_url': 'https://www.heritagepartscentre.com/uk/catalogsearch/result/?q={sku}',
+        'rest_url': 'https://www.heritagepartscentre.com/rest/V1/products',
+        'product_css': 'div.product-item-info, li.product-item',
+        'sku_css': "div.product__sku mark, div.product-item-sku, span.sku, span[itemprop='sku']",
+        'source': 'Heritage Parts Centre',
+    },
+}
+
+
+def _parse_search_page_all(html: str, config: Dict) -> Dict[str, Tuple[Optional[float], Optional[str]]]:
+    """
+    Index every product on a search-result page in one parse
+    Returns {normalized_sku: (price, product_url)} - used by the batched
+    multi-SKU searches where one page answers many lookups
+    """
+    found = {}
+    soup = BeautifulSoup(html, 'html.parser')
+    for product in soup.select(config['product_css']):
+        sku_element = product.select_one(config['sku_css'])
+        if not sku_element:
+            continue
+        product_sku = _norm_sku(sku_element.get_text())
+        if not product_sku or product_sku in found:
+            continue
+        link = product.select_one("a.product-item-link, a.product-item-photo")
+        found[product_sku] = (_price_from_listing(product), link.get('href') if link else None)
+    return found
+
+
+def _parse_search_page(html: str, config: Dict, sku_normalized: str,
+                       search_url: str) -> Tuple[Optional[float], Optional[str]]:
+    """
+    Find the matching product on a search-result page
+    Returns (price, product_url); price None with a URL set means the
+    listing matched but had no inline price, so try the product page
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    for product in soup.select(config['product_css']):
+        sku_element = product.select_one(config['sku_css'])
+        if not sku_element:
+            continue
+        product_sku = sku_element.get_text().strip()
+        if _norm_sku(product_sku) != sku_normalized:
+            continue
+
+        link = product.select_one("a.product-item-link, a.product-item-photo")
+        product_url = link.get('href') if link else search_url
+        return _price_from_listing(product), product_url
+    return None, None
+
+
+def _search_rest(sku: str, config: Dict) -> Optional[float]:
+    """
+    Try the site's Magento REST catalog endpoint - structured JSON with no
+    HTML to parse. Many deployments leave it public; quietly give up if not
+    """
+    rest_url = config.get('rest_url')
+    if not rest_url:
+        return None
+    try:
+        response = _http_session.get(rest_url, params={
+            'searchCriteria[filter_groups][0][filters][0][field]': 'sku',
+            'searchCriteria[filter_groups][0][filters][0][value]': sku,
+            'searchCriteria[filter_groups][0][filters][0][condition_type]': 'eq',
+        }, timeout=10)
+        if response.status_code != 200:
+            return None
+        for product in response.json().get('items', []):
+            price = product.get('price')
+            if price:
+                return float(price)
+    except (requests.RequestException, ValueError, TypeError):
+        return None
+    return None
+
+
+def _search_http(sku: str, website: str) -> Tuple[Optional[float], Optional[str]]:
+    """
+    Shared HTTP search for one SKU: REST JSON endpoint first, then the
+    server-rendered search page. Returns (price, product_url)
+    """
+    config = _SITE_CONFIG[website]
+    price = _search_rest(sku, config)
+    if price is not None:
+        logger.info(f"Found price £{price} for {sku} on {config['source']} (REST)")
+        return price, None
+
+    search_url = config['search_url'].format(sku=sku)
+    sku_normalized = _norm_sku(sku)
+    try:
+        response = _http_session.get(search_url, timeout=10)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logger.debug(f"HTTP search failed for {sku}: {e}")
+        return None, None
+
+    price, product_url = _parse_search_page(response.text, config, sku_normalized, search_url)
+    if price is None and product_url:
+        # Listing had no price - try the product page metadata
+        try:
+            page = _http_session.get(product_url, timeout=10)
+            page.raise_for_status()
+            price = _price_from_product_page(BeautifulSoup(page.text, 'html.parser'))
+        except requests.RequestException:
+            pass
+    return price, product_url
+
+
+def fast_get_price(item_name: str) -> Tuple[Optional[float], str, Optional[str]]:
+    """
+    Try to get a price over plain HTTP - both sites render search results
+    server-side, so most SKUs never need a browser at all
+    Returns: (price, source_website, product_url), price is None on a miss
+    """
+    description, sku = extract_sku_from_name(item_name)
+    if not sku:
+        return None, "unknown", None
+
+    website = determine_website(sku)
+    source = _SITE_CONFIG[website]['source']
+    price, product_url = _search_http(sku, website)
+    if price is not None:
+        return price, source, product_url
+
+    logger.debug(f"Fast path found no match for {sku} on {source}")
+    return None, source, None
+
+
+# Cap on in-flight fast-path requests when fetching a whole CSV at once
+ASYNC_CONCURRENCY = 32
+
+# SKUs per multi-term catalogsearch query - Magento tokenizes q on
+# whitespace, so one results page can answer a whole batch. Kept modest
+# to stay inside URL-length and results-per-page limits
+SEARCH_BATCH_SIZE = 15
+
+# Per-site request ceiling (requests/second) - each site gets its own
+# token bucket so JustKampers and Heritage don't share a delay budget
+HOST_RATE_LIMIT = 5
+
+
+class _NullLimiter:
+    """Stand-in when aiolimiter isn't installed - no pacing"""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _make_limiters() -> Dict[str, object]:
+    if AsyncLimiter is None:
+        limiter = _NullLimiter()
+        return {site: limiter for site in _SITE_CONFIG}
+    return {site: AsyncLimiter(HOST_RATE_LIMIT, 1) for site in _SITE_CONFIG}
+
+
+async def _fetch_text(session, limiter, url: str) -> str:
+    async with limiter:
+        async with session.get(url) as response:
+            if response.status == 429:
+                # Server pushed back - honour Retry-After and try once more
+                delay = min(float(response.headers.get('Retry-After') or 1), 10)
+                logger.debug(f"Rate limited on {url}, retrying in {delay}s")
+                await asyncio.sleep(delay)
+                async with session.get(url) as retried:
+                    retried.raise_for_status()
+                    return await retried.text()
+            response.raise_for_status()
+            return await response.text()
+
+
+async def _fetch_price_async(session, semaphore, limiters, item_name: str):
+    """Async twin of fast_get_price, sharing the same parsing helpers"""
+    description, sku = extract_sku_from_name(item_name)
+    if not sku:
+        return item_name, (None, 'unknown', None)
+
+    website = determine_website(sku)
+    config = _SITE_CONFIG[website]
+    limiter = limiters[website]
+    source = config['source']
+    search_url = config['search_url'].format(sku=sku)
+    sku_normalized = _norm_sku(sku)
+
+    try:
+        async with semaphore:
+            html = await _fetch_text(session, limiter, search_url)
+    except Exception as e:
+        logger.debug(f"Async fast path failed for {sku}: {e}")
+        return item_name, (None, source, None)
+
+    price, product_url = _parse_search_page(html, config, sku_normalized, search_url)
+    if price is None and product_url:
+        try:
+            async with semaphore:
+                page_html = await _fetch_text(session, limiter, product_url)
+            price = _price_from_product_page(BeautifulSoup(page_html, 'html.parser'))
+        except Exception:
+            pass
+
+    if price is not None:
+        logger.info(f"Found price £{price} for {sku} on {source} (fast path)")
+    return item_name, (price, source, product_url)
+
+
+async def _resolve_batch(session, semaphore, limiters, website, entries):
+    """
+    Resolve a batch of (item_name, sku) pairs against one site with a
+    single multi-term search; SKUs the combined page misses fall back to
+    individual queries. Returns {item_name: (price, source, url)}
+    """
+    config = _SITE_CONFIG[website]
+    source = config['source']
+    search_url = config['search_url'].format(sku='+'.join(sku for _, sku in entries))
+    found = {}
+    try:
+        async with semaphore:
+            found = _parse_search_page_all(await _fetch_text(session, limiters[website], search_url), config)
+    except Exception as e:
+        logger.debug(f"Batched search failed on {source}: {e}")
+
+    results = {}
+    misses = []
+    for name, sku in entries:
+        price, url = found.get(_norm_sku(sku), (None, None))
+        if price is not None:
+            logger.info(f"Found price £{price} for {sku} on {source} (batched)")
+            results[name] = (price, source, url)
+        else:
+            misses.append(name)
+
+    if misses:
+        singles = await asyncio.gather(
+            *[_fetch_price_async(session, semaphore, limiters, name) for name in misses]
+        )
+        results.update(dict(singles))
+    return results
+
+
+def fetch_prices_bulk(item_names: List[str]) -> Dict[str, Tuple[Optional[float], str, Optional[str]]]:
+    """
+    Fetch prices for many item names concurrently over HTTP, batching
+    SKUs into multi-term searches so one page load answers many lookups
+    Returns {item_name: (price, source, url)}; misses have price None and
+    should fall back to the Selenium scraper
+    """
+    unique_names = list(dict.fromkeys(item_names))
+    if aiohttp is None:
+        # No aiohttp - fall back to serial fast-path lookups
+        return {name: fast_get_price(name) for name in unique_names}
+
+    by_site = {}
+    results = {}
+    for name in unique_names:
+        description, sku = extract_sku_from_name(name)
+        if sku:
+            by_site.setdefault(determine_website(sku), []).append((name, sku))
+        else:
+            results[name] = (None, 'unknown', None)
+
+    async def gather_all():
+        connector = aiohttp.TCPConnector(limit_per_host=8, keepalive_timeout=60)
+        timeout = aiohttp.ClientTimeout(total=15)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers=_HTTP_HEADERS) as session:
+            semaphore = asyncio.Semaphore(ASYNC_CONCURRENCY)
+            limiters = _make_limiters()
+            batches = [
+                _resolve_batch(session, semaphore, limiters, website,
+                               entries[start:start + SEARCH_BATCH_SIZE])
+                for website, entries in by_site.items()
+                for start in range(0, len(entries), SEARCH_BATCH_SIZE)
+            ]
+            for partial in await asyncio.gather(*batches):
+                results.update(partial)
+            return results
+
+    return asyncio.run(gather_all())
+
+
+def _index_search_results(page_source: str) -> Dict[str, Tuple[Optional[float], Optional[str]]]:
+    """
+    Index a Selenium search-result page in one lxml parse
+    Returns {normalized_sku: (price, product_url)}. Every find_element is
+    an HTTP round-trip to chromedriver, so pulling page_source once and
+    walking the tree locally replaces products x selectors RPCs with one.
+    Empty dict means the caller should fall back to element-by-element
+    """
+    if lxml_html is None:
+        return {}
+    try:
+        tree = lxml_html.fromstring(page_source)
+    except Exception:
+        return {}
+
+    index = {}
+    products = tree.xpath(
+        '//*[contains(concat(" ", normalize-space(@class), " "), " product-item ")'
+        ' or contains(concat(" ", normalize-space(@class), " "), " product-item-info ")]'
+    )
+    for node in products:
+        sku_nodes = node.xpath(
+            './/div[contains(@class, "amlabel-text")]'
+            ' | .//div[contains(@class, "product__sku")]//mark'
+            ' | .//div[contains(@class, "product-item-sku")]'
+            ' | .//span[@itemprop="sku"]'
+            ' | .//span[contains(concat(" ", normalize-space(@class), " "), " sku ")]'
+            ' | .//div[contains(concat(" ", normalize-space(@class), " "), " sku ")]'
+        )
+        if not sku_nodes:
+            continue
+        norm = _norm_sku(sku_nodes[0].text_content())
+        if not norm or norm in index:
+            continue
+
+        price = None
+        for price_node in node.xpath('.//span[@data-price-amount or @data-price-including-tax]'):
+            for attr in ('data-price-including-tax', 'data-price-amount'):
+                value = price_node.get(attr)
+                if value:
+                    try:
+                        price = float(value)
+                        break
+                    except ValueError:
+                        pass
+            if price is not None:
+                break
+        if price is None:
+            for price_node in node.xpath('.//span[contains(@class, "price")]'):
+                price_match = _PRICE_RE.search(price_node.text_content())
+                if price_match:
+                    candidate = float(price_match.group().replace(',', ''))
+                    if candidate > 0:
+                        price = candidate
+                        break
+
+        links = node.xpath(
+            './/a[contains(@class, "product-item-link")'
+            ' or contains(@class, "product-item-photo")]/@href'
+        )
+        index[norm] = (price, links[0] if links else None)
+    return index
+
 
 class PartsPriceScraper:
     """Scraper for parts prices from JustKampers and Heritage Parts Centre"""
     
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, driver_path: Optional[str] = None):
         """Initialize the scraper with Chrome options"""
+        self.driver_path = driver_path  # pre-resolved chromedriver, if any
         self.options = Options()
         if headless:
             self.options.add_argument('--headless=new')
         self.options.add_argument('--no-sandbox')
         self.options.add_argument('--disable-dev-shm-usage')
         self.options.add_argument('--disable-blink-features=AutomationControlled')
+        self.options.add_argument('--disable-gpu')
+        self.options.add_argument('--disable-extensions')
+        # Skip images/CSS/fonts - we only parse price text, so this is wasted bandwidth
+        self.options.add_argument('--blink-settings=imagesEnabled=false')
+        self.options.add_argument('--disable-background-networking')
+        self.options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
         self.options.add_experimental_option("excludeSwitches", ["enable-automation"])
         self.options.add_experimental_option('useAutomationExtension', False)
         self.options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
         
         self.driver = None
         self.last_website = None  # Track which website was last accessed
+        self._cookies_accepted = set()  # Domains whose cookie banner we've dismissed
         
     def start_driver(self, force_restart=False, timeout=30):
         """Start the Chrome driver"""
@@ -53,37 +593,36 @@ class PartsPriceScraper:
             self.close_driver()
         
         if not self.driver:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=self.options)
+            service = Service(self.driver_path or ChromeDriverManager().install())
+            # keep_alive reuses one HTTP connection to chromedriver instead
+            # of a fresh TCP connect per WebDriver command
+            self.driver = webdriver.Chrome(service=service, options=self.options,
+                                           keep_alive=True)
             self.driver.set_page_load_timeout(timeout)
-            self.driver.implicitly_wait(5)
+            # No implicit wait: the search methods wait explicitly for the
+            # results grid, so every selector in the fallback chains that
+            # misses would otherwise block here for the full implicit
+            # timeout before trying the next one
+            self.driver.implicitly_wait(0)
+            self._cookies_accepted.clear()
     
     def close_driver(self):
         """Close the Chrome driver"""
         if self.driver:
             self.driver.quit()
             self.driver = None
+            self._cookies_accepted.clear()
     
     def extract_sku_from_name(self, item_name: str) -> Tuple[str, str]:
         """
         Extract SKU and description from item name
         Returns: (description, sku)
         """
-        # Split by last space to separate SKU from description
-        parts = item_name.rsplit(' ', 1)
-        if len(parts) == 2:
-            description, sku = parts
-            # Clean up SKU - remove trailing slashes and spaces
-            sku = sku.strip().rstrip('/')
-            return description.strip(), sku
-        return item_name, ""
-    
+        return extract_sku_from_name(item_name)
+
     def determine_website(self, sku: str) -> str:
         """Determine which website to search based on SKU prefix"""
-        if sku.startswith('J'):
-            return 'justkampers'
-        else:
-            return 'heritage'
+        return determine_website(sku)
     
     def search_justkampers(self, sku: str, retry_count: int = 0) -> Tuple[Optional[float], Optional[str]]:
         """
@@ -91,15 +630,14 @@ class PartsPriceScraper:
         Returns (price, product_url) if found, (None, None) otherwise
         """
         try:
-            # Restart driver if we were on Heritage before (to avoid state issues)
-            force_restart = (self.last_website == 'heritage' or retry_count > 0)
-            # Use shorter timeout for JustKampers to fail fast
-            self.start_driver(force_restart=force_restart, timeout=15)
+            # Reuse the session across sites; only restart on a retry
+            # after a failure
+            self.start_driver(force_restart=retry_count > 0, timeout=15)
             self.last_website = 'justkampers'
             
             # Clean SKU for search
             search_sku = sku.strip()
-            search_sku_normalized = search_sku.upper()
+            search_sku_normalized = _norm_sku(search_sku)
             
             # Search URL
             search_url = f"https://www.justkampers.com/catalogsearch/result/?q={search_sku}"
@@ -107,17 +645,26 @@ class PartsPriceScraper:
             
             self.driver.get(search_url)
             
-            # Handle cookie popup if present
+            # Handle cookie popup if present (once per driver session)
+            if 'justkampers' not in self._cookies_accepted:
+                try:
+                    cookie_button = WebDriverWait(self.driver, 3).until(
+                        EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Accept') or contains(text(), 'ACCEPT') or contains(text(), 'accept') or contains(@class, 'accept') or contains(@id, 'accept')]"))
+                    )
+                    cookie_button.click()
+                    logger.info("Accepted cookies on JustKampers")
+                except:
+                    pass  # Cookie popup might not appear or already accepted
+                self._cookies_accepted.add('justkampers')
+            
+            # Wait for either results or the "no results" notice, whichever
+            # comes first, instead of relying on the implicit wait
             try:
-                cookie_button = WebDriverWait(self.driver, 3).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Accept') or contains(text(), 'ACCEPT') or contains(text(), 'accept') or contains(@class, 'accept') or contains(@id, 'accept')]"))
+                WebDriverWait(self.driver, 5).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.product-item, div.message.notice"))
                 )
-                cookie_button.click()
-                logger.info("Accepted cookies on JustKampers")
-            except:
-                pass  # Cookie popup might not appear or already accepted
-            
-            # Check for products
+            except TimeoutException:
+                pass
             
             # Look for product items
             products = self.driver.find_elements(By.CSS_SELECTOR, "div.product-item")
@@ -128,6 +675,19 @@ class PartsPriceScraper:
             
             logger.info(f"Found {len(products)} products on JustKampers")
             
+            # Index the whole page in one parse; only fall back to
+            # per-element WebDriver calls when the parse yields nothing
+            index = _index_search_results(self.driver.page_source)
+            if index:
+                price, product_url = index.get(search_sku_normalized, (None, None))
+                if price is not None:
+                    logger.info(f"Found price £{price} for {search_sku} on JustKampers (page parse)")
+                    return price, product_url or self.driver.current_url
+                if search_sku_normalized not in index:
+                    logger.warning(f"No exact match found for {search_sku} on JustKampers")
+                    return None, None
+                # Listed without an inline price - click through below
+            
             # Check each product for matching SKU
             for product in products:
                 try:
@@ -143,18 +703,11 @@ class PartsPriceScraper:
                             break
                     
                     # Check if this is our SKU (case-insensitive)
-                    if product_sku.upper() == search_sku_normalized:
+                    if _norm_sku(product_sku) == search_sku_normalized:
                         logger.info(f"Found matching product with SKU {product_sku}")
                         
                         # Extract price from this product
-                        price_selectors = [
-                            "span.price",
-                            "span[data-price-type='finalPrice']",
-                            "div.price-box span.price",
-                            "span.price-wrapper span.price"
-                        ]
-                        
-                        for selector in price_selectors:
+                        for selector in _JK_PRICE_SELECTORS:
                             try:
                                 price_element = product.find_element(By.CSS_SELECTOR, selector)
                                 
@@ -174,7 +727,7 @@ class PartsPriceScraper:
                                 # Otherwise get from text
                                 price_text = price_element.text
                                 if price_text:
-                                    price_match = re.search(r'[\d,]+\.?\d*', price_text)
+                                    price_match = _PRICE_RE.search(price_text)
                                     if price_match:
                                         price = float(price_match.group().replace(',', ''))
                                         # Get product URL
@@ -197,12 +750,12 @@ class PartsPriceScraper:
                             product_url = self.driver.current_url
                             
                             # Try to get price from product page
-                            for selector in price_selectors:
+                            for selector in _JK_PRICE_SELECTORS:
                                 try:
                                     price_element = self.driver.find_element(By.CSS_SELECTOR, selector)
                                     price_text = price_element.text
                                     
-                                    price_match = re.search(r'[\d,]+\.?\d*', price_text)
+                                    price_match = _PRICE_RE.search(price_text)
                                     if price_match:
                                         price = float(price_match.group().replace(',', ''))
                                         logger.info(f"Found price £{price} for {search_sku} on JustKampers (product page)")
@@ -245,15 +798,14 @@ class PartsPriceScraper:
         Returns (price, product_url) if found, (None, None) otherwise
         """
         try:
-            # Don't restart driver if we're already on Heritage
-            force_restart = (self.last_website == 'justkampers')
-            self.start_driver(force_restart=force_restart)
+            # Reuse the session across sites
+            self.start_driver()
             self.last_website = 'heritage'
             
             # Clean SKU for search - Heritage sometimes has different formatting
             search_sku = sku.strip().rstrip('/')
-            # Remove spaces that might be in Heritage SKUs (make case-insensitive)
-            search_sku_normalized = search_sku.replace(' ', '').replace('/', '').upper()
+            # Remove separators that might be in Heritage SKUs (make case-insensitive)
+            search_sku_normalized = _norm_sku(search_sku)
             
             # Search URL
             search_url = f"https://www.heritagepartscentre.com/uk/catalogsearch/result/?q={search_sku}"
@@ -261,22 +813,24 @@ class PartsPriceScraper:
             
             self.driver.get(search_url)
             
-            # Handle cookie popup if present (Cookiebot)
-            try:
-                # Try to click the OK/Accept button on the Cookiebot dialog
-                cookie_button = WebDriverWait(self.driver, 3).until(
-                    EC.element_to_be_clickable((By.ID, "CybotCookiebotDialogBodyLevelButtonAccept"))
-                )
-                cookie_button.click()
-                logger.info("Accepted cookies on Heritage (Cookiebot)")
-            except:
+            # Handle cookie popup if present (Cookiebot, once per driver session)
+            if 'heritage' not in self._cookies_accepted:
                 try:
-                    # Alternative: try other cookie accept buttons
-                    cookie_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'OK') or contains(text(), 'Accept')]")
+                    # Try to click the OK/Accept button on the Cookiebot dialog
+                    cookie_button = WebDriverWait(self.driver, 3).until(
+                        EC.element_to_be_clickable((By.ID, "CybotCookiebotDialogBodyLevelButtonAccept"))
+                    )
                     cookie_button.click()
-                    logger.info("Accepted cookies on Heritage")
+                    logger.info("Accepted cookies on Heritage (Cookiebot)")
                 except:
-                    pass  # Cookie popup might not appear or already accepted
+                    try:
+                        # Alternative: try other cookie accept buttons
+                        cookie_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'OK') or contains(text(), 'Accept')]")
+                        cookie_button.click()
+                        logger.info("Accepted cookies on Heritage")
+                    except:
+                        pass  # Cookie popup might not appear or already accepted
+                self._cookies_accepted.add('heritage')
             
             # Wait for search results
             try:
@@ -299,19 +853,23 @@ class PartsPriceScraper:
             
             logger.info(f"Found {len(products)} products to check")
             
+            # Same one-parse shortcut as JustKampers
+            index = _index_search_results(self.driver.page_source)
+            if index:
+                price, product_url = index.get(search_sku_normalized, (None, None))
+                if price is not None:
+                    logger.info(f"Found price £{price} for {search_sku} on Heritage (page parse)")
+                    return price, product_url or self.driver.current_url
+                if search_sku_normalized not in index:
+                    logger.warning(f"No exact match found for {search_sku} on Heritage")
+                    return None, None
+                # Listed without an inline price - click through below
+            
             for i, product in enumerate(products):
                 try:
                     # Check SKU in product info - multiple possible locations
                     sku_text = ""
-                    sku_selectors = [
-                        "div.product__sku mark",  # This is what Heritage uses
-                        "div.product-item-sku",
-                        "span.sku",
-                        "div.sku",
-                        "span[itemprop='sku']"
-                    ]
-                    
-                    for selector in sku_selectors:
+                    for selector in _HER_SKU_SELECTORS:
                         try:
                             sku_element = product.find_element(By.CSS_SELECTOR, selector)
                             sku_text = sku_element.text.strip()
@@ -333,23 +891,12 @@ class PartsPriceScraper:
                     product_sku = sku_text
                     
                     # Normalize for comparison (case-insensitive)
-                    product_sku_normalized = product_sku.replace(' ', '').replace('/', '').upper()
+                    product_sku_normalized = _norm_sku(product_sku)
                     search_normalized = search_sku_normalized
                     
                     if product_sku_normalized == search_normalized:
                         # Found exact match, get price
-                        price_selectors = [
-                            "span.price-wrapper[data-price-including-tax] span.price",  # Heritage's exact selector
-                            "span[itemprop='lowPrice']",  # Alternative Heritage selector
-                            "span.price:not(:empty)",
-                            "span[data-price-type='finalPrice'] span.price",
-                            "div.price-box span[data-price-amount]",
-                            "span.price-wrapper span.price",
-                            "div.price-final_price span.price",
-                            "span.regular-price span.price"
-                        ]
-                        
-                        for selector in price_selectors:
+                        for selector in _HER_PRICE_SELECTORS:
                             try:
                                 price_element = product.find_element(By.CSS_SELECTOR, selector)
                                 
@@ -370,7 +917,7 @@ class PartsPriceScraper:
                                 
                                 if price_text:
                                     # Extract numeric price
-                                    price_match = re.search(r'[\d,]+\.?\d*', str(price_text))
+                                    price_match = _PRICE_RE.search(str(price_text))
                                     if price_match:
                                         price = float(price_match.group().replace(',', ''))
                                         if price > 0:  # Make sure we have a valid price
@@ -394,12 +941,12 @@ class PartsPriceScraper:
                         product_url = self.driver.current_url
                         
                         # Try to get price from product page
-                        for selector in price_selectors:
+                        for selector in _HER_PRICE_SELECTORS:
                             try:
                                 price_element = self.driver.find_element(By.CSS_SELECTOR, selector)
                                 price_text = price_element.text
                                 
-                                price_match = re.search(r'[\d,]+\.?\d*', price_text)
+                                price_match = _PRICE_RE.search(price_text)
                                 if price_match:
                                     price = float(price_match.group().replace(',', ''))
                                     logger.info(f"Found price £{price} for {search_sku} on Heritage (product page)")
@@ -430,13 +977,107 @@ class PartsPriceScraper:
             return None, "unknown", None
         
         website = self.determine_website(sku)
-        
-        if website == 'justkampers':
-            price, url = self.search_justkampers(sku)
-            return price, 'JustKampers', url
-        else:
-            price, url = self.search_heritage(sku)
-            return price, 'Heritage Parts Centre', url
+        source = _SITE_CONFIG[website]['source']
+
+        cache_key = f"{website}:{sku.upper()}"
+        if _price_cache is not None:
+            hit = _price_cache.get(cache_key)
+            if hit is not None:
+                # Negative entries come back as (None, None) and skip the scrape
+                price, url = hit
+                return price, source, url
+
+        # HTTP search first; Chrome only drives when that misses (set
+        # FORCE_SELENIUM=1 to skip straight to the browser)
+        price = None
+        url = None
+        if not os.getenv('FORCE_SELENIUM'):
+            price, url = _search_http(sku, website)
+
+        if price is None:
+            if website == 'justkampers':
+                price, url = self.search_justkampers(sku)
+            else:
+                price, url = self.search_heritage(sku)
+
+        if _price_cache is not None:
+            ttl = PRICE_CACHE_TTL if price is not None else NEGATIVE_CACHE_TTL
+            _price_cache.set(cache_key, (price, url), expire=ttl)
+        return price, source, url
+
+
+# Per-worker scraper for the multiprocessing Chrome pool: built lazily on
+# the first lookup a worker handles, then reused for every SKU dispatched
+# to that worker
+_worker_scraper = None
+
+
+def _pool_init(driver_path: str):
+    global _worker_scraper
+    _worker_scraper = PartsPriceScraper(headless=True, driver_path=driver_path)
+    atexit.register(_worker_scraper.close_driver)
+
+
+def _pool_get_price(item_name: str):
+    return item_name, _worker_scraper.get_price(item_name)
+
+
+def scrape_prices_parallel(item_names: List[str],
+                           max_workers: Optional[int] = None) -> Dict[str, Tuple[Optional[float], str, Optional[str]]]:
+    """
+    Resolve item names with a pool of headless Chromes, one per worker
+    process - the lookups are independent, so this scales near-linearly
+    with cores. chromedriver is resolved once here rather than racing a
+    download per worker. Returns {item_name: (price, source, url)}
+    """
+    unique_names = [name for name in dict.fromkeys(item_names) if name]
+    if not unique_names:
+        return {}
+
+    driver_path = ChromeDriverManager().install()
+    workers = min(max_workers or os.cpu_count() or 1, len(unique_names))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_pool_init,
+                             initargs=(driver_path,)) as executor:
+        return dict(executor.map(_pool_get_price, unique_names, chunksize=8))
+
+
+# Per-row result records: fixed fields, thousands of instances, so slots
+# beat dicts on both memory and attribute access during the report sort.
+# __slots__ is declared explicitly (not via dataclass(slots=True)) to
+# keep the Python 3.8 floor documented in the README
+
+
+@dataclass
+class Update:
+    __slots__ = ('item_code', 'item_name', 'old_price', 'new_price',
+                 'difference', 'difference_percent', 'source', 'url')
+    item_code: str
+    item_name: str
+    old_price: float
+    new_price: float
+    difference: float
+    difference_percent: float
+    source: str
+    url: Optional[str]
+
+
+@dataclass
+class Error:
+    __slots__ = ('item_code', 'item_name', 'current_price', 'error')
+    item_code: str
+    item_name: str
+    current_price: float
+    error: str
+
+
+@dataclass
+class Unchanged:
+    __slots__ = ('item_code', 'item_name', 'price', 'source', 'url')
+    item_code: str
+    item_name: str
+    price: float
+    source: str
+    url: Optional[str]
 
 
 def process_xero_export(input_file: str, output_file: str, update_file: str):
@@ -448,24 +1089,49 @@ def process_xero_export(input_file: str, output_file: str, update_file: str):
         output_file: Path to save the updated CSV for Xero import
         update_file: Path to save the price comparison report
     """
-    scraper = PartsPriceScraper(headless=True)
-    
-    try:
-        # Read the input CSV
-        with open(input_file, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            items = list(reader)
-        
-        # Prepare update report
-        updates = []
-        errors = []
-        unchanged = []
-        
-        # Process each item
-        total_items = len(items)
-        logger.info(f"Processing {total_items} items...")
-        
-        for i, item in enumerate(items, 1):
+    # First pass: just the item names, for the concurrent fast path.
+    # Cheap (no row objects are kept) and keeps memory flat on big exports
+    with open(input_file, 'r', encoding='utf-8-sig') as f:
+        item_names = [row.get('ItemName', '') for row in csv.DictReader(f)]
+
+    total_items = len(item_names)
+    logger.info(f"Processing {total_items} items...")
+
+    # Collapse duplicate SKUs before dispatch - Xero exports repeat the
+    # same SKU across variants and kits, and each SKU only needs looking
+    # up once. One representative item name is scraped per SKU and the
+    # result fanned back out to every row sharing it
+    sku_by_name = {name: extract_sku_from_name(name)[1] for name in dict.fromkeys(item_names)}
+    representatives = {}
+    for name, sku in sku_by_name.items():
+        representatives.setdefault(sku or name, name)
+
+    # Resolve everything the HTTP fast path can find in one concurrent
+    # pass, then fan the misses out over the parallel Chrome pool
+    results = fetch_prices_bulk(list(representatives.values()))
+    misses = [name for name, (price, _, _) in results.items() if price is None and name]
+    if misses:
+        logger.info(f"Falling back to Selenium for {len(misses)} items...")
+        results.update(scrape_prices_parallel(misses))
+
+    for name, sku in sku_by_name.items():
+        if name not in results:
+            results[name] = results[representatives[sku or name]]
+
+    # Prepare update report
+    updates = []
+    errors = []
+    unchanged = []
+
+    # Second pass streams each row straight to the output CSV as it is
+    # processed, so a mid-run crash keeps everything finished so far
+    with open(input_file, 'r', encoding='utf-8-sig') as fin, \
+            open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as fout:
+        reader = csv.DictReader(fin)
+        writer = csv.DictWriter(fout, fieldnames=reader.fieldnames)
+        writer.writeheader()
+
+        for i, item in enumerate(reader, 1):
             item_code = item.get('ItemCode', item.get('*ItemCode', ''))
             item_name = item.get('ItemName', '')
             current_price = float(item.get('SalesUnitPrice', 0))
@@ -473,92 +1139,74 @@ def process_xero_export(input_file: str, output_file: str, update_file: str):
             logger.info(f"[{i}/{total_items}] Processing: {item_name}")
             
             # Get new price
-            new_price, source, url = scraper.get_price(item_name)
+            new_price, source, url = results.get(item_name, (None, 'unknown', None))
             
             if new_price is not None:
                 price_diff = new_price - current_price
                 price_diff_pct = (price_diff / current_price * 100) if current_price > 0 else 0
                 
                 if abs(price_diff) > 0.01:  # Price changed
-                    updates.append({
-                        'ItemCode': item_code,
-                        'ItemName': item_name,
-                        'OldPrice': current_price,
-                        'NewPrice': new_price,
-                        'Difference': price_diff,
-                        'DifferencePercent': price_diff_pct,
-                        'Source': source,
-                        'URL': url
-                    })
+                    updates.append(Update(item_code, item_name, current_price,
+                                          new_price, price_diff, price_diff_pct,
+                                          source, url))
                     # Update the item's price
                     item['SalesUnitPrice'] = str(new_price)
                 else:
-                    unchanged.append({
-                        'ItemCode': item_code,
-                        'ItemName': item_name,
-                        'Price': current_price,
-                        'Source': source,
-                        'URL': url
-                    })
+                    unchanged.append(Unchanged(item_code, item_name,
+                                               current_price, source, url))
             else:
-                errors.append({
-                    'ItemCode': item_code,
-                    'ItemName': item_name,
-                    'CurrentPrice': current_price,
-                    'Error': 'Price not found'
-                })
-            
-        
-        # Write the updated CSV for Xero import
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            fieldnames = list(items[0].keys())
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(items)
-        
-        # Write the update report
-        with open(update_file, 'w', newline='', encoding='utf-8') as f:
-            f.write(f"Price Update Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 80 + "\n\n")
-            
-            f.write(f"Summary:\n")
-            f.write(f"Total items processed: {total_items}\n")
-            f.write(f"Prices updated: {len(updates)}\n")
-            f.write(f"Prices unchanged: {len(unchanged)}\n")
-            f.write(f"Errors: {len(errors)}\n\n")
-            
-            if updates:
-                f.write("PRICE UPDATES:\n")
-                f.write("-" * 80 + "\n")
-                for update in sorted(updates, key=lambda x: abs(x['DifferencePercent']), reverse=True):
-                    f.write(f"\n{update['ItemCode']}: {update['ItemName']}\n")
-                    f.write(f"  Source: {update['Source']}\n")
-                    f.write(f"  Old Price: £{update['OldPrice']:.2f}\n")
-                    f.write(f"  New Price: £{update['NewPrice']:.2f}\n")
-                    f.write(f"  Difference: £{update['Difference']:+.2f} ({update['DifferencePercent']:+.1f}%)\n")
-            
-            if errors:
-                f.write("\n\nERRORS (prices not found):\n")
-                f.write("-" * 80 + "\n")
-                for error in errors:
-                    f.write(f"\n{error['ItemCode']}: {error['ItemName']}\n")
-                    f.write(f"  Current Price: £{error['CurrentPrice']:.2f}\n")
-                    f.write(f"  Error: {error['Error']}\n")
-            
-            if unchanged:
-                f.write("\n\nUNCHANGED PRICES:\n")
-                f.write("-" * 80 + "\n")
-                for item in unchanged:
-                    f.write(f"{item['ItemCode']}: {item['ItemName']} - £{item['Price']:.2f} ({item['Source']})\n")
-        
-        logger.info(f"Processing complete!")
-        logger.info(f"Updated CSV saved to: {output_file}")
-        logger.info(f"Update report saved to: {update_file}")
-        
-        return updates, errors, unchanged
-        
-    finally:
-        scraper.close_driver()
+                errors.append(Error(item_code, item_name, current_price,
+                                    'Price not found'))
+
+            writer.writerow(item)
+            if i % 50 == 0:
+                fout.flush()
+    
+    # Write the update report: assembled as a list of strings and flushed
+    # with one writelines call instead of thousands of tiny writes
+    parts = [
+        f"Price Update Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+        "=" * 80 + "\n\n",
+        "Summary:\n",
+        f"Total items processed: {total_items}\n",
+        f"Prices updated: {len(updates)}\n",
+        f"Prices unchanged: {len(unchanged)}\n",
+        f"Errors: {len(errors)}\n\n",
+    ]
+    
+    if updates:
+        parts.append("PRICE UPDATES:\n")
+        parts.append("-" * 80 + "\n")
+        for update in sorted(updates, key=lambda u: abs(u.difference_percent), reverse=True):
+            parts.append(f"\n{update.item_code}: {update.item_name}\n"
+                         f"  Source: {update.source}\n"
+                         f"  Old Price: £{update.old_price:.2f}\n"
+                         f"  New Price: £{update.new_price:.2f}\n"
+                         f"  Difference: £{update.difference:+.2f} ({update.difference_percent:+.1f}%)\n")
+    
+    if errors:
+        parts.append("\n\nERRORS (prices not found):\n")
+        parts.append("-" * 80 + "\n")
+        for error in errors:
+            parts.append(f"\n{error.item_code}: {error.item_name}\n"
+                         f"  Current Price: £{error.current_price:.2f}\n"
+                         f"  Error: {error.error}\n")
+    
+    if unchanged:
+        parts.append("\n\nUNCHANGED PRICES:\n")
+        parts.append("-" * 80 + "\n")
+        parts.extend(f"{item.item_code}: {item.item_name} - £{item.price:.2f} ({item.source})\n"
+                     for item in unchanged)
+    
+    with open(update_file, 'w', newline='', encoding='utf-8') as f:
+        f.writelines(parts)
+    
+    logger.info(f"Processing complete!")
+    logger.info(f"Updated CSV saved to: {output_file}")
+    logger.info(f"Update report saved to: {update_file}")
+    
+    return updates, errors, unchanged
+    
 
 
 if __name__ == "__main__":